@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+"""
+Native DC Power Flow and Sensitivity Analysis
+
+Solves batched DC power flows and computes PTDF matrices directly from the reduced nodal susceptance matrix B'
+of a PowSyBl network: B' is factored once with SuperLU and only the
+right-hand sides that are needed are back-solved. Post-contingency PTDFs are
+obtained from the base case with LODF (rank-one Woodbury) updates instead of
+refactoring B' for every outage.
+
+Modelling assumptions (classic DC approximation):
+- Connected lines and 2-winding transformers only, series reactance only
+- Main connected component only: buses outside it get zero angles and
+  branches outside it are flagged as disconnected rather than modelled
+- Transformer ratios and phase shifts are ignored
+- Single slack bus (most meshed bus) absorbs all injection changes
+
+B' is assembled by a numba kernel when numba is installed (plain Python
+loops otherwise) and can be built once with build_dc_model() and shared.
+"""
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to plain (slower) Python loops
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Denominator threshold below which an outage is considered to island the network
+ISLANDING_TOLERANCE = 1e-8
+
+# LODF entries at or below this magnitude are screened out: the monitored
+# branch is treated as unaffected and keeps its base case PTDF row
+LODF_SCREENING_THRESHOLD = 1e-4
+
+
+def _branch_table(network, bus_ids):
+    """Connected lines and 2-winding transformers between the given buses, with per-unit reactance"""
+    per_unit = network.per_unit
+    network.per_unit = True
+    try:
+        columns = ['x', 'bus1_id', 'bus2_id', 'connected1', 'connected2']
+        branches = pd.concat([
+            network.get_lines()[columns],
+            network.get_2_windings_transformers()[columns]
+        ])
+    finally:
+        network.per_unit = per_unit
+
+    connected = (branches['connected1'] & branches['connected2']
+                 & branches['bus1_id'].isin(bus_ids) & branches['bus2_id'].isin(bus_ids))
+    return branches[connected]
+
+
+def _positions(index, ids, kind):
+    """Positions of ids in index, raising if any id is unknown"""
+    positions = index.get_indexer(ids)
+    if (positions < 0).any():
+        missing = [i for i, p in zip(ids, positions) if p < 0][:5]
+        raise ValueError(f"Unknown or disconnected {kind}: {missing}")
+    return positions
+
+
+@njit(cache=True, fastmath=True)
+def build_bprime(from_idx, to_idx, susceptance, in_model, slack):
+    """Assemble the reduced susceptance matrix B' directly in CSC form
+
+    Only buses flagged in in_model are kept (the slack excluded). Branch
+    stamps are written as COO triplets (at most 4 per branch), skipping the
+    slack row/column, then bucketed by column with a counting sort.
+    Returns (data, indices, indptr) for a square matrix over the kept buses,
+    possibly with duplicate entries, and the reduced position of every bus
+    (-1 = slack or not modelled).
+    """
+    num_buses = len(in_model)
+    reduced = np.empty(num_buses, np.int64)
+    position = 0
+    for bus in range(num_buses):
+        if bus == slack or not in_model[bus]:
+            reduced[bus] = -1
+        else:
+            reduced[bus] = position
+            position += 1
+
+    num_branches = len(from_idx)
+    rows = np.empty(4 * num_branches, np.int64)
+    cols = np.empty(4 * num_branches, np.int64)
+    vals = np.empty(4 * num_branches, np.float64)
+    count = 0
+    for branch in range(num_branches):
+        f = reduced[from_idx[branch]]
+        t = reduced[to_idx[branch]]
+        b = susceptance[branch]
+        if f >= 0:
+            rows[count], cols[count], vals[count] = f, f, b
+            count += 1
+        if t >= 0:
+            rows[count], cols[count], vals[count] = t, t, b
+            count += 1
+        if f >= 0 and t >= 0:
+            rows[count], cols[count], vals[count] = f, t, -b
+            count += 1
+            rows[count], cols[count], vals[count] = t, f, -b
+            count += 1
+
+    size = position
+    indptr = np.zeros(size + 1, np.int64)
+    for entry in range(count):
+        indptr[cols[entry] + 1] += 1
+    for col in range(size):
+        indptr[col + 1] += indptr[col]
+
+    indices = np.empty(count, np.int64)
+    data = np.empty(count, np.float64)
+    next_slot = indptr[:-1].copy()
+    for entry in range(count):
+        slot = next_slot[cols[entry]]
+        indices[slot] = rows[entry]
+        data[slot] = vals[entry]
+        next_slot[cols[entry]] += 1
+
+    return data, indices, indptr, reduced
+
+
+def build_dc_model(network):
+    """Assemble and factor the reduced susceptance matrix B' of a network once
+
+    Returns a dict holding the bus and (modelled) branch indexes, branch
+    terminal bus positions, branch susceptances, the slack bus and the
+    SuperLU factor of B'.
+    Build it once and pass it to run_dc_batched() / compute_ptdf_native() to
+    share the factorization between analyses on the same network state.
+    """
+    buses = network.get_buses()
+    # Buses outside the main connected component (including isolated buses)
+    # would leave B' singular with a single slack, so they are not modelled
+    in_model = (buses['connected_component'] == 0).to_numpy()
+    branches = _branch_table(network, buses.index[in_model])
+    num_buses = len(buses)
+
+    from_idx = _positions(buses.index, branches['bus1_id'], 'buses')
+    to_idx = _positions(buses.index, branches['bus2_id'], 'buses')
+    susceptance = 1.0 / branches['x'].to_numpy(dtype=np.float64)
+
+    # The most meshed bus is the slack; its row/column is dropped to make B' non-singular
+    degree = np.bincount(np.concatenate([from_idx, to_idx]), minlength=num_buses)
+    slack = int(np.argmax(degree))
+
+    data, indices, indptr, reduced = build_bprime(from_idx, to_idx, susceptance, in_model, slack)
+    size = len(indptr) - 1
+    bprime = sp.csc_matrix((data, indices, indptr), shape=(size, size))
+    bprime.sum_duplicates()
+
+    return {
+        'buses': buses.index,
+        'branches': branches.index,
+        'from_idx': from_idx,
+        'to_idx': to_idx,
+        'susceptance': susceptance,
+        'slack': slack,
+        'keep': np.flatnonzero(reduced >= 0),
+        'reduced': reduced,
+        'lu': spla.splu(bprime)
+    }
+
+
+def _solve_angles(model, rhs):
+    """Back-solve all columns of a reduced RHS at once, slack angle = 0"""
+    angles = np.zeros((len(model['buses']), rhs.shape[1]))
+    angles[model['keep']] = model['lu'].solve(rhs)
+    return angles
+
+
+def _unit_injection_angles(model, bus_idx, signs):
+    """Bus angles for unit injections (one column per entry of bus_idx's last axis)"""
+    num_columns = bus_idx.shape[-1]
+    columns = np.broadcast_to(np.arange(num_columns), bus_idx.shape)
+    # Injections at the slack or at disconnected buses (index -1) do not move any angle
+    rhs_rows = np.where(bus_idx >= 0, model['reduced'][bus_idx], -1)
+    active = rhs_rows >= 0
+    # Dense, column-major RHS so SuperLU back-substitutes every column in one call
+    rhs = np.zeros((len(model['keep']), num_columns), order='F')
+    rhs[rhs_rows[active], columns[active]] = signs[active]
+    return _solve_angles(model, rhs)
+
+
+def _branch_flows(model, angles, branch_idx):
+    """Flows on the given branches for each column of bus angles"""
+    from_idx, to_idx = model['from_idx'], model['to_idx']
+    return model['susceptance'][branch_idx, None] * (angles[from_idx[branch_idx]]
+                                                     - angles[to_idx[branch_idx]])
+
+
+def bus_injections(network):
+    """Per-unit net active power injection (generation - load) at each bus of the network"""
+    buses = network.get_buses()
+    per_unit = network.per_unit
+    network.per_unit = True
+    try:
+        generators = network.get_generators()
+        loads = network.get_loads()
+    finally:
+        network.per_unit = per_unit
+
+    injections = np.zeros(len(buses))
+    for bus_ids, power in ((generators['bus_id'], generators['target_p']),
+                           (loads['bus_id'], -loads['p0'])):
+        positions = buses.index.get_indexer(bus_ids)
+        connected = positions >= 0
+        np.add.at(injections, positions[connected], power.to_numpy()[connected])
+    return injections
+
+
+def run_dc_batched(network, injections_matrix, model=None):
+    """Solve T DC power flows sharing one factorization of B'
+
+    injections_matrix holds per-unit bus injections (buses x T, in the order
+    of network.get_buses()); the slack bus balances each column. All columns
+    are back-solved in a single call, so the cost is one factorization plus
+    T cheap triangular solves. Returns bus angles (buses x T) and per-unit
+    branch flows (branches x T) together with the branch ids. Pass a
+    prebuilt model from build_dc_model() to skip assembly and factorization.
+    """
+    if model is None:
+        model = build_dc_model(network)
+    injections_matrix = np.asarray(injections_matrix, dtype=np.float64)
+    if injections_matrix.ndim == 1:
+        injections_matrix = injections_matrix[:, None]
+
+    angles = _solve_angles(model, injections_matrix[model['keep']])
+    flows = _branch_flows(model, angles, np.arange(len(model['branches'])))
+
+    return {
+        'branches': model['branches'],
+        'angles': angles,
+        'flows': flows
+    }
+
+
+def compute_ptdf_native(network, contingency_branches, monitored_branches,
+                        injection_points, model=None):
+    """Compute base case and post-contingency PTDFs from one LU factorization of B'
+
+    Returns a dict with the base PTDF (monitored x injections), the screened
+    LODF matrix as a scipy.sparse.csr_matrix (contingencies x monitored, only
+    entries above LODF_SCREENING_THRESHOLD are kept) and the PTDF of each
+    outaged branch (contingencies x injections). Use post_contingency_ptdf()
+    to expand a single contingency. Disconnected injections get zero
+    sensitivities and contingencies that island the network are flagged in
+    'islanding' with an empty LODF row. Monitored and contingency branches
+    that are disconnected (or outside the main component) are flagged in
+    'disconnected_monitored' / 'disconnected_contingencies': they carry no
+    flow and their outage changes nothing. Pass a prebuilt model from
+    build_dc_model() to skip assembly and factorization.
+    """
+    if model is None:
+        model = build_dc_model(network)
+    buses, branches = model['buses'], model['branches']
+    from_idx, to_idx, susceptance = model['from_idx'], model['to_idx'], model['susceptance']
+
+    injection_bus_ids = pd.concat([
+        network.get_generators()['bus_id'],
+        network.get_loads()['bus_id']
+    ])
+    injection_buses = buses.get_indexer(injection_bus_ids.loc[injection_points])
+
+    # Branches missing from the model are flagged and computed as branch 0,
+    # then zeroed, so one disconnected branch does not abort the whole analysis
+    monitored_pos = branches.get_indexer(monitored_branches)
+    outage_pos = branches.get_indexer(contingency_branches)
+    disconnected_monitored = monitored_pos < 0
+    disconnected_outages = outage_pos < 0
+    monitored_idx = np.maximum(monitored_pos, 0)
+    outage_idx = np.maximum(outage_pos, 0)
+    num_injections = len(injection_buses)
+    num_outages = len(outage_idx)
+
+    # One pass of back-substitutions against the shared base factor solves both
+    # the base case (a unit injection per column) and the contingency side (a
+    # unit transfer across each outaged branch, from which the LODFs follow)
+    rhs_buses = np.vstack([
+        np.concatenate([injection_buses, np.where(disconnected_outages, -1, from_idx[outage_idx])]),
+        np.concatenate([np.full(num_injections, -1), np.where(disconnected_outages, -1, to_idx[outage_idx])])
+    ])
+    rhs_signs = np.vstack([
+        np.ones(num_injections + num_outages),
+        np.concatenate([np.zeros(num_injections), -np.ones(num_outages)])
+    ])
+    angles = _unit_injection_angles(model, rhs_buses, rhs_signs)
+    injection_angles = angles[:, :num_injections]
+    transfer_angles = angles[:, num_injections:]
+
+    # Base case PTDF and the PTDF of each outaged branch
+    base = _branch_flows(model, injection_angles, monitored_idx)
+    outage_ptdf = _branch_flows(model, injection_angles, outage_idx)
+    base[disconnected_monitored] = 0.0
+    outage_ptdf[disconnected_outages] = 0.0
+
+    # LODF from the unit transfer responses
+    monitored_transfer = _branch_flows(model, transfer_angles, monitored_idx)
+    columns = np.arange(num_outages)
+    self_transfer = susceptance[outage_idx] * (transfer_angles[from_idx[outage_idx], columns]
+                                               - transfer_angles[to_idx[outage_idx], columns])
+
+    denominator = 1.0 - self_transfer
+    islanding = np.abs(denominator) < ISLANDING_TOLERANCE
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lodf = (monitored_transfer / denominator).T
+    lodf[(outage_pos[:, None] == monitored_pos[None, :]) & ~disconnected_outages[:, None]] = -1.0
+    lodf[islanding] = 0.0
+    lodf[:, disconnected_monitored] = 0.0
+
+    # Keep only the (contingency, monitored) pairs whose flow actually changes
+    mask = np.abs(lodf) > LODF_SCREENING_THRESHOLD
+    contingency_pos, monitored_pos = np.nonzero(mask)
+    lodf = sp.csr_matrix((lodf[mask], (contingency_pos, monitored_pos)), shape=mask.shape)
+
+    return {
+        'monitored': list(monitored_branches),
+        'injections': list(injection_points),
+        'contingencies': list(contingency_branches),
+        'slack_bus': buses[model['slack']],
+        'base': base,
+        'lodf': lodf,
+        'outage_ptdf': outage_ptdf,
+        'islanding': islanding,
+        'disconnected_monitored': disconnected_monitored,
+        'disconnected_contingencies': disconnected_outages
+    }
+
+
+def post_contingency_ptdf(ptdf, contingency):
+    """Expand the post-contingency PTDF (monitored x injections) for one contingency index
+
+    Only the monitored branches that survived LODF screening are updated;
+    the others report their base case PTDF (as do disconnected contingency
+    branches, whose outage changes nothing). Islanding contingencies are NaN.
+    """
+    if ptdf['islanding'][contingency]:
+        return np.full_like(ptdf['base'], np.nan)
+
+    lodf = ptdf['lodf']
+    start, end = lodf.indptr[contingency], lodf.indptr[contingency + 1]
+    affected = lodf.indices[start:end]
+
+    post = ptdf['base'].copy()
+    post[affected] += lodf.data[start:end, None] * ptdf['outage_ptdf'][contingency, None, :]
+    return post
@@ -10,52 +10,156 @@ across 4 key power system analyses:
 3. DC N-1 Contingency Analysis
 4. PTDF Matrix Calculation
 
-Usage: python3 run_comparison.py
+Usage: python3 run_comparison.py [--parallel]
 """
 
+import argparse
+import contextlib
 import subprocess
 import json
+import orjson
+import thread_env  # pins BLAS threads; must precede pandas/numpy
 import pandas as pd
 from datetime import datetime
 import os
+from pathlib import Path
 import sys
+import threading
+import time
 
+COMMAND_TIMEOUT = 1800  # 30 minute timeout per benchmark
 
-def run_command(command, description):
-    """Run a command and capture output"""
+
+# Serializes whole-line writes from the Julia reader thread and the in-process
+# PowSyBl benchmark so their output never interleaves mid-line
+_OUTPUT_LOCK = threading.Lock()
+
+
+class _PrefixedWriter:
+    """File-like stdout replacement that prefixes each complete line with a label
+
+    Partial lines (e.g. time_operation's "description..." before its timing)
+    are held back until their newline arrives, then written in one piece.
+    """
+
+    def __init__(self, label, stream):
+        self.label = label
+        self.stream = stream
+        self._pending = ''
+
+    def write(self, text):
+        self._pending += text
+        *complete, self._pending = self._pending.split('\n')
+        if complete:
+            with _OUTPUT_LOCK:
+                self.stream.write(''.join(f"[{self.label}] {line}\n" for line in complete))
+                self.stream.flush()
+        return len(text)
+
+    def flush(self):
+        # print(..., flush=True) calls this; partial lines stay pending
+        self.stream.flush()
+
+    def close_line(self):
+        """Emit any trailing partial line"""
+        if self._pending:
+            self.write('\n')
+
+
+def _drain_output(process, label, lines, stream):
+    """Echo a child's output line by line as it arrives, keeping a copy"""
+    for line in process.stdout:
+        with _OUTPUT_LOCK:
+            stream.write(f"[{label}] {line}")
+            stream.flush()
+        lines.append(line)
+
+
+def launch_command(command, description, label):
+    """Start a command in the background, streaming its output live
+
+    Returns (process, reader thread, captured lines). stderr is merged into
+    stdout so both are shown in order; each line is prefixed with the label
+    so concurrent commands can be told apart.
+    """
     print(f"\n{'='*60}")
     print(f" {description}")
     print(f"{'='*60}")
     print(f"Running: {command}")
 
+    # Launch with the environment from before thread_env's pinning, which only
+    # applies to the PowSyBl side
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        env=thread_env.ORIGINAL_ENV,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    lines = []
+    # Bind the real stdout now: it may be redirected later for the in-process run
+    reader = threading.Thread(target=_drain_output, args=(process, label, lines, sys.stdout),
+                              daemon=True)
+    reader.start()
+    return process, reader, lines
+
+
+def wait_command(job, description, timeout):
+    """Wait for a launched command and report its outcome"""
+    process, reader, lines = job
+
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minute timeout
-        )
-
-        if result.returncode == 0:
+        process.wait(timeout=timeout)
+        reader.join()
+        stdout = ''.join(lines)
+
+        print(f"\n{'='*60}")
+        print(f" {description}")
+        print(f"{'='*60}")
+        if process.returncode == 0:
             print("✅ SUCCESS")
-            if result.stdout:
-                print(result.stdout)
-            return True, result.stdout, result.stderr
+            return True, stdout, ""
         else:
-            print(f"❌ FAILED (exit code: {result.returncode})")
-            if result.stderr:
-                print("STDERR:", result.stderr)
-            if result.stdout:
-                print("STDOUT:", result.stdout)
-            return False, result.stdout, result.stderr
+            print(f"❌ FAILED (exit code: {process.returncode})")
+            return False, stdout, ""
 
     except subprocess.TimeoutExpired:
-        print("❌ TIMEOUT (30 minutes)")
-        return False, "", "Timeout after 30 minutes"
+        process.kill()
+        process.wait()
+        reader.join()
+        print(f"❌ TIMEOUT ({description}, 30 minutes)")
+        return False, ''.join(lines), "Timeout after 30 minutes"
     except Exception as e:
         print(f"❌ ERROR: {e}")
-        return False, "", str(e)
+        return False, ''.join(lines), str(e)
+
+
+def run_powsybl_in_process(test_system):
+    """Run the PowSyBl benchmark in this interpreter and return (success, results)
+
+    Importing the benchmark instead of spawning python3 avoids a second
+    interpreter and pypowsybl runtime start-up. Its output is prefixed with
+    [PowSyBl] like the PowerModels.jl subprocess output.
+    """
+    print(f"\n{'='*60}")
+    print(" RUNNING POWSYBL BENCHMARK (in-process)")
+    print(f"{'='*60}")
+
+    try:
+        from benchmark_powsybl import main as powsybl_main
+        writer = _PrefixedWriter("PowSyBl", sys.stdout)
+        try:
+            with contextlib.redirect_stdout(writer):
+                results = powsybl_main(test_system)
+        finally:
+            writer.close_line()
+        print("✅ SUCCESS")
+        return True, results
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False, None
 
 
 def load_json_results(filename):
@@ -148,27 +252,30 @@ def compare_ptdf_matrices():
 
 
 def save_comparison_report(comparison_df, powsybl_results,
-                           powermodels_results):
+                           powermodels_results, parallel=False):
     """Save comprehensive comparison report"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = f"benchmark_comparison_{timestamp}.json"
 
     report = {
         "timestamp": datetime.now().isoformat(),
+        # Concurrent runs share the CPU, so their timings (and speedups) are contended
+        "run_mode": "parallel" if parallel else "sequential",
+        "timings_contended": parallel,
         "powsybl_results": powsybl_results,
         "powermodels_results": powermodels_results,
         "comparison_summary": comparison_df.to_dict('records') if
         comparison_df is not None else None
     }
 
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(report_file, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     print(f"\n📊 Comprehensive comparison report saved to: {report_file}")
     return report_file
 
 
-def main():
+def main(parallel=False):
     print("🔍 POWER SYSTEM BENCHMARK COMPARISON")
     print("="*60)
     print("Running comprehensive benchmark comparison between:")
@@ -191,25 +298,35 @@ def main():
 
     print("\n🧹 Cleaning up old result files...")
     for file in old_files:
-        if os.path.exists(file):
-            os.remove(file)
-            print(f"   Removed: {file}")
+        try:
+            Path(file).unlink()
+        except FileNotFoundError:
+            continue
+        print(f"   Removed: {file}")
 
     results = {}
 
-    # Run PowSyBl benchmark
-    success, stdout, stderr = run_command(
-        "python3 benchmark_powsybl.py",
-        "RUNNING POWSYBL BENCHMARK"
-    )
-    results['powsybl_success'] = success
-    results['powsybl_output'] = stdout
-
-    # Run PowerModels.jl benchmark
-    success, stdout, stderr = run_command(
-        "julia benchmark_powermodels.jl",
-        "RUNNING POWERMODELS.JL BENCHMARK"
-    )
+    if parallel:
+        # The Julia benchmark runs as a separate runtime in the background while
+        # the PowSyBl benchmark runs in-process (both write distinct outputs).
+        # Both compete for the same cores, so the timings are contended.
+        print("\n⚠️  Parallel mode: both benchmarks share the CPU, timings are contended")
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        powermodels_job = launch_command("julia benchmark_powermodels.jl",
+                                         "RUNNING POWERMODELS.JL BENCHMARK",
+                                         "PowerModels.jl")
+        results['powsybl_success'], powsybl_results = run_powsybl_in_process(test_system)
+    else:
+        # One benchmark at a time, so neither is timed on a loaded machine
+        results['powsybl_success'], powsybl_results = run_powsybl_in_process(test_system)
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        powermodels_job = launch_command("julia benchmark_powermodels.jl",
+                                         "RUNNING POWERMODELS.JL BENCHMARK",
+                                         "PowerModels.jl")
+
+    success, stdout, _ = wait_command(powermodels_job,
+                                      "RUNNING POWERMODELS.JL BENCHMARK",
+                                      max(0, deadline - time.monotonic()))
     results['powermodels_success'] = success
     results['powermodels_output'] = stdout
 
@@ -218,7 +335,6 @@ def main():
     print(" LOADING RESULTS")
     print(f"{'='*60}")
 
-    powsybl_results = load_json_results("powsybl_results.json")
     powermodels_results = load_json_results("powermodels_results.json")
 
     if powsybl_results:
@@ -234,7 +350,7 @@ def main():
 
     # Save comprehensive report
     report_file = save_comparison_report(comparison_df, powsybl_results,
-                                         powermodels_results)
+                                         powermodels_results, parallel)
 
     # Final summary
     print(f"\n{'='*60}")
@@ -251,8 +367,9 @@ def main():
             print("   ❌ PowerModels.jl benchmark failed")
 
     print("\nResults files:")
+    present = {entry.name for entry in os.scandir('.') if entry.is_file()}
     for file in ["powsybl_results.json", "powermodels_results.json", report_file]:
-        if os.path.exists(file):
+        if file in present:
             print(f"  ✅ {file}")
         else:
             print(f"  ❌ {file} (not created)")
@@ -261,5 +378,10 @@ def main():
 
 
 if __name__ == "__main__":
-    exit_code = main()
+    parser = argparse.ArgumentParser(description="PowSyBl vs PowerModels.jl benchmark comparison")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run both benchmarks at the same time (faster, but the timings "
+                             "are contended and recorded as such in the report)")
+    args = parser.parse_args()
+    exit_code = main(parallel=args.parallel)
     sys.exit(exit_code)
@@ -0,0 +1,17 @@
+"""
+Thread pool pinning shared by the benchmark scripts
+
+Import this before numpy/scipy/pandas: it pins the BLAS/OpenMP thread pools
+to the physical cores (assuming 2-way SMT) to avoid oversubscription. Values
+already set in the environment take precedence.
+
+ORIGINAL_ENV keeps the environment as it was before pinning, for child
+processes (the PowerModels.jl benchmark) that must not inherit it.
+"""
+
+import os
+
+ORIGINAL_ENV = os.environ.copy()
+PHYSICAL_CORES = max(1, (os.cpu_count() or 2) // 2)
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, str(PHYSICAL_CORES))
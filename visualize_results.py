@@ -9,130 +9,221 @@ Generates comprehensive visualizations comparing PowSyBl and PowerModels.jl perf
 3. Memory allocation comparison
 4. Performance breakdown by test type
 
-Requires: matplotlib, seaborn, pandas
+Requires: matplotlib, numpy, orjson
 """
 
-import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import argparse
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import orjson
 import numpy as np
 from pathlib import Path
 
-# Set style for professional-looking plots
-sns.set_style("whitegrid")
-sns.set_context("notebook", font_scale=1.2)
-plt.rcParams['figure.figsize'] = (14, 10)
-plt.rcParams['font.family'] = 'sans-serif'
+# Set style for professional-looking plots: seaborn's "whitegrid" style with the
+# "notebook" context at font_scale=1.2, inlined so seaborn is not imported
+_RC = {
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.labelsize': 14.4,
+    'axes.linewidth': 1.25,
+    'axes.titlesize': 14.4,
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'font.size': 14.4,
+    'grid.color': '.8',
+    'grid.linewidth': 1.0,
+    'legend.fontsize': 13.2,
+    'legend.title_fontsize': 14.4,
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'text.color': '.15',
+    'xtick.bottom': False,
+    'xtick.color': '.15',
+    'xtick.labelsize': 13.2,
+    'xtick.major.size': 6.0,
+    'xtick.major.width': 1.25,
+    'xtick.minor.size': 4.0,
+    'xtick.minor.width': 1.0,
+    'ytick.color': '.15',
+    'ytick.labelsize': 13.2,
+    'ytick.left': False,
+    'ytick.major.size': 6.0,
+    'ytick.major.width': 1.25,
+    'ytick.minor.size': 4.0,
+    'ytick.minor.width': 1.0,
+    'figure.figsize': (14, 10),
+}
+
+def _setup_matplotlib():
+    """Import pyplot on the file-only Agg backend and apply the plot style
+
+    matplotlib is only needed by the processes that draw, so importing this
+    module (or running main) does not pay for it up front.
+    """
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(_RC)
+    return plt
 
-def load_results():
-    """Load benchmark results from JSON files"""
-    with open('powsybl_results.json', 'r') as f:
-        powsybl = json.load(f)
+# Output resolution; 150 dpi keeps the 14x10 in. figures legible at a quarter of the pixels of 300
+DPI = int(os.environ.get('VIZ_DPI', '150'))
 
-    with open('powermodels_results.json', 'r') as f:
-        powermodels = json.load(f)
+# Fast zlib level (bigger files, much cheaper encode) and no Software text chunk
+PNG_OPTIONS = {'pil_kwargs': {'compress_level': 1}, 'metadata': {'Software': None}}
 
-    return powsybl, powermodels
+# timing_ms keys of the four tests, in chart order
+KEYS = ('ac_power_flow', 'dc_power_flow', 'dc_contingency_analysis', 'ptdf_calculation')
 
-def create_timing_comparison(powsybl, powermodels, output_dir):
-    """Create side-by-side timing comparison with log scale"""
+# Text panels of the summary dashboard
+_METRICS_TEMPLATE = """
+    Network Size:
+    • Buses: {buses:,}
+    • Branches: {branches:,}
+    • Generators: {generators}
+    • Loads: {loads:,}
 
-    # Extract timing data
-    tests = ['AC Power Flow', 'DC Power Flow', 'DC Contingency (500)', 'PTDF + 500 Contingencies']
-    powsybl_times = [
-        powsybl['timing_ms']['ac_power_flow'],
-        powsybl['timing_ms']['dc_power_flow'],
-        powsybl['timing_ms']['dc_contingency_analysis'],
-        powsybl['timing_ms']['ptdf_calculation']
-    ]
-    powermodels_times = [
-        powermodels['timing_ms']['ac_power_flow'],
-        powermodels['timing_ms']['dc_power_flow'],
-        powermodels['timing_ms']['dc_contingency_analysis'],
-        powermodels['timing_ms']['ptdf_calculation']
-    ]
+    Test Configuration:
+    • Contingencies: {contingencies:,}
+    • Monitored Branches: {monitored_branches:,}
+    • Injection Points: {injection_points:,}
+    """
 
-    # Convert to seconds for better readability
-    powsybl_sec = [t / 1000 for t in powsybl_times]
-    powermodels_sec = [t / 1000 for t in powermodels_times]
+_FINDINGS_TEXT = """
+    Key Findings:
 
-    # Create DataFrame
-    df = pd.DataFrame({
-        'Test': tests * 2,
-        'Time (seconds)': powsybl_sec + powermodels_sec,
-        'Package': ['PowSyBl'] * len(tests) + ['PowerModels.jl'] * len(tests)
-    })
+    ✓ 3.6-50x faster overall
 
-    # Create plot
-    fig, ax = plt.subplots(figsize=(14, 8))
+    ✓ Algorithmic advantage
+      (not language speed)
+
+    ✓ Batch processing
+      vs sequential
+
+    ✓ In-place modification
+      (both packages)
+
+    ✓ Specialized solvers
+      vs generic Ipopt
+    """
+
+_COMPARISON_TEXT = """
+    ALGORITHMIC DIFFERENCES (The Real Performance Driver):
 
+    ┌────────────────────────────────────────────────────────────────────────────────────────────────────────────────────┐
+    │  PowSyBl (Fast)                                    │  PowerModels.jl (Slower)                                      │
+    ├────────────────────────────────────────────────────┼───────────────────────────────────────────────────────────────┤
+    │  • Batch processing (single analysis object)       │  • Sequential processing (500 separate Ipopt calls)           │
+    │  • Matrix factorization reuse                      │  • Full matrix rebuild each time                              │
+    │  • Incremental network updates                     │  • In-place branch status modification                        │
+    │  • Specialized power flow solvers                  │  • Generic Ipopt optimization                                 │
+    │  • Sherman-Morrison-Woodbury formula               │  • Complete PTDF matrix recalculation                         │
+    │  • In-place modifications                          │  • Pre-compiled (warm Julia)                                  │
+    └────────────────────────────────────────────────────┴───────────────────────────────────────────────────────────────┘
+
+    CONCLUSION: PowSyBl is 3.6-50x faster due to ALGORITHMIC design, not language performance.
+    """
+
+@functools.lru_cache(maxsize=4)
+def _read_results(path, mtime):
+    """Parse one results file; mtime is part of the cache key so edits invalidate it"""
+    return orjson.loads(Path(path).read_bytes())
+
+def load_results(powsybl_path='powsybl_results.json',
+                 powermodels_path='powermodels_results.json'):
+    """Load benchmark results from JSON files"""
+    powsybl = _read_results(powsybl_path, os.path.getmtime(powsybl_path))
+    powermodels = _read_results(powermodels_path, os.path.getmtime(powermodels_path))
+
+    return powsybl, powermodels
+
+load_results.cache_clear = _read_results.cache_clear
+
+def _format_durations(seconds):
+    """Bar labels for durations in seconds: ms below 1s, s below a minute, else min"""
+    seconds = np.asarray(seconds, dtype=np.float64)
+    return np.where(seconds < 1, np.char.mod('%.0fms', seconds * 1000),
+                    np.where(seconds < 60, np.char.mod('%.1fs', seconds),
+                             np.char.mod('%.1fmin', seconds / 60)))
+
+def _speedup_colors(speedups):
+    """Darker green for larger speedups: >10x, >5x, otherwise"""
+    return np.select([speedups > 10, speedups > 5], ['#2E7D32', '#43A047'],
+                     default='#66BB6A').tolist()
+
+def _save_figure(fig, output_dir, name):
+    """Write <name>.png at DPI, plus a vector <name>.svg when the worker was started with save_svg"""
+    fig.savefig(output_dir / f'{name}.png', dpi=DPI, **PNG_OPTIONS)
+    if _save_svg:
+        fig.savefig(output_dir / f'{name}.svg')
+    print(f"✓ Created {name}.png" + (" and .svg" if _save_svg else ""))
+
+def _draw_grouped_log_bars(ax, ps_sec, pm_sec, tests, *, add_labels=True,
+                           label_size=10, **bar_style):
+    """Side-by-side PowSyBl / PowerModels.jl bars on a log time axis"""
     x = np.arange(len(tests))
     width = 0.35
 
-    bars1 = ax.bar(x - width/2, powsybl_sec, width, label='PowSyBl',
-                   color='#2E86AB', alpha=0.8, edgecolor='black', linewidth=1.5)
-    bars2 = ax.bar(x + width/2, powermodels_sec, width, label='PowerModels.jl',
-                   color='#A23B72', alpha=0.8, edgecolor='black', linewidth=1.5)
+    bars1 = ax.bar(x - width/2, ps_sec, width, label='PowSyBl',
+                   color='#2E86AB', alpha=0.8, **bar_style)
+    bars2 = ax.bar(x + width/2, pm_sec, width, label='PowerModels.jl',
+                   color='#A23B72', alpha=0.8, **bar_style)
+    ax.set(yscale='log', xticks=x)
+
+    if add_labels:
+        ax.bar_label(bars1, labels=_format_durations(ps_sec), padding=2,
+                     fontsize=label_size, fontweight='bold')
+        ax.bar_label(bars2, labels=_format_durations(pm_sec), padding=2,
+                     fontsize=label_size, fontweight='bold')
+
+def create_timing_comparison(fig, ps_ms, pm_ms, output_dir):
+    """Create side-by-side timing comparison with log scale"""
+
+    tests = ['AC Power Flow', 'DC Power Flow', 'DC Contingency (500)', 'PTDF + 500 Contingencies']
+
+    # Convert to seconds for better readability
+    powsybl_sec = ps_ms / 1000
+    powermodels_sec = pm_ms / 1000
+
+    # Create plot
+    fig.clear()
+    fig.set_size_inches(14, 8)
+    ax = fig.add_subplot()
 
     # Use log scale for better visualization
-    ax.set_yscale('log')
+    _draw_grouped_log_bars(ax, powsybl_sec, powermodels_sec, tests,
+                           edgecolor='black', linewidth=1.5)
 
     # Labels and title
     ax.set_xlabel('Test Type', fontsize=14, fontweight='bold')
     ax.set_ylabel('Time (seconds, log scale)', fontsize=14, fontweight='bold')
     ax.set_title('PowSyBl vs PowerModels.jl: Execution Time Comparison\n(Lower is Better)',
                  fontsize=16, fontweight='bold', pad=20)
-    ax.set_xticks(x)
     ax.set_xticklabels(tests, rotation=15, ha='right')
     ax.legend(fontsize=12, loc='upper left')
 
-    # Add value labels on bars
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height < 1:
-                label = f'{height*1000:.0f}ms'
-            elif height < 60:
-                label = f'{height:.1f}s'
-            else:
-                label = f'{height/60:.1f}min'
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   label, ha='center', va='bottom', fontsize=10, fontweight='bold')
-
     # Add grid
     ax.grid(True, alpha=0.3, axis='y')
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'timing_comparison.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Created timing_comparison.png")
-    plt.close()
+    _save_figure(fig, output_dir, 'timing_comparison')
 
-def create_speedup_chart(powsybl, powermodels, output_dir):
+def create_speedup_chart(fig, speedups, output_dir):
     """Create speedup ratio bar chart"""
 
     tests = ['AC Power Flow', 'DC Power Flow', 'DC Contingency\n(500)', 'PTDF + 500\nContingencies']
-    powsybl_times = [
-        powsybl['timing_ms']['ac_power_flow'],
-        powsybl['timing_ms']['dc_power_flow'],
-        powsybl['timing_ms']['dc_contingency_analysis'],
-        powsybl['timing_ms']['ptdf_calculation']
-    ]
-    powermodels_times = [
-        powermodels['timing_ms']['ac_power_flow'],
-        powermodels['timing_ms']['dc_power_flow'],
-        powermodels['timing_ms']['dc_contingency_analysis'],
-        powermodels['timing_ms']['ptdf_calculation']
-    ]
-
-    # Calculate speedup (PowSyBl is faster, so ratio > 1)
-    speedups = [pm / ps for ps, pm in zip(powsybl_times, powermodels_times)]
+
 
     # Create plot
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig.clear()
+    fig.set_size_inches(12, 7)
+    ax = fig.add_subplot()
 
     # Create color map based on speedup magnitude
-    colors = ['#2E7D32' if s > 10 else '#43A047' if s > 5 else '#66BB6A' for s in speedups]
+    colors = _speedup_colors(speedups)
 
     bars = ax.barh(tests, speedups, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
 
@@ -155,17 +246,16 @@ def create_speedup_chart(powsybl, powermodels, output_dir):
 
     # Add grid
     ax.grid(True, alpha=0.3, axis='x')
-    ax.set_xlim(0, max(speedups) * 1.15)
+    ax.set_xlim(0, speedups.max() * 1.15)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'speedup_comparison.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Created speedup_comparison.png")
-    plt.close()
+    _save_figure(fig, output_dir, 'speedup_comparison')
 
-def create_memory_comparison(output_dir):
+def create_memory_comparison(fig, output_dir):
     """Create memory allocation comparison visualization"""
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig.clear()
+    fig.set_size_inches(14, 6)
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Data: both packages use efficient in-place modification
     packages = ['PowSyBl', 'PowerModels.jl']
@@ -201,13 +291,10 @@ def create_memory_comparison(output_dir):
         ax2.text(bar.get_x() + bar.get_width()/2., height,
                 label, ha='center', va='bottom', fontsize=11, fontweight='bold')
 
-    plt.suptitle('Memory Efficiency Comparison', fontsize=16, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(output_dir / 'memory_comparison.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Created memory_comparison.png")
-    plt.close()
+    fig.suptitle('Memory Efficiency Comparison', fontsize=16, fontweight='bold')
+    _save_figure(fig, output_dir, 'memory_comparison')
 
-def create_julia_compilation_impact(output_dir):
+def create_julia_compilation_impact(fig, output_dir):
     """Visualize key performance metrics for both packages"""
 
     tests = ['AC Power Flow', 'DC Power Flow', 'DC Contingency (500)', 'PTDF + 500 Contingencies']
@@ -216,114 +303,63 @@ def create_julia_compilation_impact(output_dir):
     powsybl_times = [0.464, 0.053, 1.660, 47.5]
     powermodels_times = [1.691, 0.294, 82.561, 346.3]
 
-    x = np.arange(len(tests))
-    width = 0.35
+    fig.clear()
+    fig.set_size_inches(14, 8)
+    ax = fig.add_subplot()
 
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    bars1 = ax.bar(x - width/2, powsybl_times, width, label='PowSyBl',
-                   color='#2E86AB', alpha=0.8, edgecolor='black', linewidth=1.5)
-    bars2 = ax.bar(x + width/2, powermodels_times, width, label='PowerModels.jl',
-                   color='#A23B72', alpha=0.8, edgecolor='black', linewidth=1.5)
+    _draw_grouped_log_bars(ax, powsybl_times, powermodels_times, tests, label_size=9,
+                           edgecolor='black', linewidth=1.5)
 
     ax.set_ylabel('Time (seconds, log scale)', fontsize=13, fontweight='bold')
     ax.set_title('Performance Comparison: PowSyBl vs PowerModels.jl\n(Algorithm & Architecture Drive Performance Gap)',
                  fontsize=15, fontweight='bold', pad=20)
-    ax.set_xticks(x)
     ax.set_xticklabels(tests, fontsize=11)
     ax.legend(fontsize=12, loc='upper left')
-    ax.set_yscale('log')
     ax.grid(True, alpha=0.3, axis='y')
 
-    # Add value labels
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height < 1:
-                label = f'{height*1000:.0f}ms'
-            elif height < 60:
-                label = f'{height:.1f}s'
-            else:
-                label = f'{height/60:.1f}min'
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   label, ha='center', va='bottom', fontsize=9, fontweight='bold')
-
     # Add annotation
     ax.text(0.02, 0.98, 'Key Factors:\n• Batch vs Sequential\n• Specialized vs Generic Solvers\n• Matrix Reuse vs Recalculation',
             transform=ax.transAxes, fontsize=11, verticalalignment='top',
             bbox=dict(boxstyle='round,pad=0.8', facecolor='lightyellow', alpha=0.8))
 
-    plt.tight_layout()
-    plt.savefig(output_dir / 'julia_compilation_impact.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Created julia_compilation_impact.png")
-    plt.close()
+    _save_figure(fig, output_dir, 'julia_compilation_impact')
 
-def create_summary_dashboard(powsybl, powermodels, output_dir):
+def create_summary_dashboard(fig, powsybl, ps_ms, pm_ms, speedups, output_dir):
     """Create a comprehensive summary dashboard"""
 
-    fig = plt.figure(figsize=(16, 10))
-    gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+    fig.clear()
+    fig.set_size_inches(16, 10)
+    gs = fig.add_gridspec(3, 3)
 
     # Main title
     fig.suptitle('PowSyBl vs PowerModels.jl: Comprehensive Performance Analysis',
-                 fontsize=18, fontweight='bold', y=0.98)
+                 fontsize=18, fontweight='bold')
 
     # 1. Timing comparison (top left - spans 2 columns)
     ax1 = fig.add_subplot(gs[0, :2])
     tests = ['AC\nPower Flow', 'DC\nPower Flow', 'DC Contingency\n(500)', 'PTDF + 500\nContingencies']
-    powsybl_times = [
-        powsybl['timing_ms']['ac_power_flow'] / 1000,
-        powsybl['timing_ms']['dc_power_flow'] / 1000,
-        powsybl['timing_ms']['dc_contingency_analysis'] / 1000,
-        powsybl['timing_ms']['ptdf_calculation'] / 1000
-    ]
-    powermodels_times = [
-        powermodels['timing_ms']['ac_power_flow'] / 1000,
-        powermodels['timing_ms']['dc_power_flow'] / 1000,
-        powermodels['timing_ms']['dc_contingency_analysis'] / 1000,
-        powermodels['timing_ms']['ptdf_calculation'] / 1000
-    ]
-
-    x = np.arange(len(tests))
-    width = 0.35
-    bars1 = ax1.bar(x - width/2, powsybl_times, width, label='PowSyBl',
-                    color='#2E86AB', alpha=0.8)
-    bars2 = ax1.bar(x + width/2, powermodels_times, width, label='PowerModels.jl',
-                    color='#A23B72', alpha=0.8)
-    ax1.set_yscale('log')
+    _draw_grouped_log_bars(ax1, ps_ms / 1000, pm_ms / 1000, tests, add_labels=False)
     ax1.set_ylabel('Time (seconds, log scale)', fontsize=11, fontweight='bold')
     ax1.set_title('Execution Time Comparison', fontsize=12, fontweight='bold')
-    ax1.set_xticks(x)
     ax1.set_xticklabels(tests, fontsize=9)
     ax1.legend(fontsize=9)
     ax1.grid(True, alpha=0.3, axis='y')
 
     # 2. Speedup ratios (top right)
     ax2 = fig.add_subplot(gs[0, 2])
-    speedups = [pm / ps for ps, pm in zip(powsybl_times, powermodels_times)]
-    colors = ['#2E7D32' if s > 10 else '#43A047' if s > 5 else '#66BB6A' for s in speedups]
+    colors = _speedup_colors(speedups)
     ax2.barh(['AC PF', 'DC PF', 'DC Cont', 'PTDF'], speedups, color=colors, alpha=0.8)
     ax2.set_xlabel('Speedup', fontsize=11, fontweight='bold')
     ax2.set_title('PowSyBl Speedup', fontsize=12, fontweight='bold')
     ax2.grid(True, alpha=0.3, axis='x')
+    ax2.set_xlim(0, speedups.max() * 1.15)
     for i, s in enumerate(speedups):
         ax2.text(s, i, f'{s:.1f}x', va='center', ha='left', fontsize=9, fontweight='bold')
 
     # 3. Key metrics (middle row)
     ax3 = fig.add_subplot(gs[1, 0])
     ax3.axis('off')
-    metrics_text = f"""
-    Network Size:
-    • Buses: {powsybl['network_info']['buses']:,}
-    • Branches: {powsybl['network_info']['branches']:,}
-    • Generators: {powsybl['network_info']['generators']}
-    • Loads: {powsybl['network_info']['loads']:,}
-
-    Test Configuration:
-    • Contingencies: 500
-    • Monitored Branches: 1,000
-    • Injection Points: 500
-    """
+    metrics_text = _METRICS_TEMPLATE.format_map({**powsybl['network_info'], **powsybl['config']})
     ax3.text(0.1, 0.5, metrics_text, fontsize=10, verticalalignment='center',
              family='monospace', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.3))
     ax3.set_title('System Configuration', fontsize=12, fontweight='bold')
@@ -342,33 +378,15 @@ def create_summary_dashboard(powsybl, powermodels, output_dir):
             color='#A23B72', alpha=0.8)
     ax4.set_ylabel('Successful Solves', fontsize=11, fontweight='bold')
     ax4.set_title('Success Rates', fontsize=12, fontweight='bold')
-    ax4.set_xticks(x_pos)
+    ax4.set(xticks=x_pos, ylim=(495, 502))
     ax4.set_xticklabels(['DC Contingency', 'PTDF'], fontsize=9)
-    ax4.set_ylim([495, 502])
     ax4.legend(fontsize=9)
     ax4.grid(True, alpha=0.3, axis='y')
 
     # 5. Key findings (middle right)
     ax5 = fig.add_subplot(gs[1, 2])
     ax5.axis('off')
-    findings_text = """
-    Key Findings:
-
-    ✓ 3.6-50x faster overall
-
-    ✓ Algorithmic advantage
-      (not language speed)
-
-    ✓ Batch processing
-      vs sequential
-
-    ✓ In-place modification
-      (both packages)
-
-    ✓ Specialized solvers
-      vs generic Ipopt
-    """
-    ax5.text(0.1, 0.5, findings_text, fontsize=10, verticalalignment='center',
+    ax5.text(0.1, 0.5, _FINDINGS_TEXT, fontsize=10, verticalalignment='center',
              bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.3))
     ax5.set_title('Performance Insights', fontsize=12, fontweight='bold')
 
@@ -376,30 +394,45 @@ def create_summary_dashboard(powsybl, powermodels, output_dir):
     ax6 = fig.add_subplot(gs[2, :])
     ax6.axis('off')
 
-    comparison_text = """
-    ALGORITHMIC DIFFERENCES (The Real Performance Driver):
-
-    ┌────────────────────────────────────────────────────────────────────────────────────────────────────────────────────┐
-    │  PowSyBl (Fast)                                    │  PowerModels.jl (Slower)                                      │
-    ├────────────────────────────────────────────────────┼───────────────────────────────────────────────────────────────┤
-    │  • Batch processing (single analysis object)       │  • Sequential processing (500 separate Ipopt calls)           │
-    │  • Matrix factorization reuse                      │  • Full matrix rebuild each time                              │
-    │  • Incremental network updates                     │  • In-place branch status modification                        │
-    │  • Specialized power flow solvers                  │  • Generic Ipopt optimization                                 │
-    │  • Sherman-Morrison-Woodbury formula               │  • Complete PTDF matrix recalculation                         │
-    │  • In-place modifications                          │  • Pre-compiled (warm Julia)                                  │
-    └────────────────────────────────────────────────────┴───────────────────────────────────────────────────────────────┘
-
-    CONCLUSION: PowSyBl is 3.6-50x faster due to ALGORITHMIC design, not language performance.
-    """
-    ax6.text(0.05, 0.5, comparison_text, fontsize=9, verticalalignment='center',
+    ax6.text(0.05, 0.5, _COMPARISON_TEXT, fontsize=9, verticalalignment='center',
              family='monospace', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.5))
 
-    plt.savefig(output_dir / 'summary_dashboard.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Created summary_dashboard.png")
-    plt.close()
+    _save_figure(fig, output_dir, 'summary_dashboard')
+
+def _warm_font_cache():
+    """Build matplotlib's on-disk font list before the render workers start
 
-def main():
+    On a cold cache every spawned worker would otherwise scan the system fonts
+    and write the same fontlist JSON concurrently; afterwards they just load it.
+    """
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    from matplotlib.font_manager import FontProperties, findfont
+    findfont(FontProperties(family=_RC['font.sans-serif'], weight='bold'))
+
+# Figure reused by every chart a render worker draws and whether SVGs are saved
+# too, set once by _init_render_worker
+_figure = None
+_save_svg = False
+
+def _init_render_worker(save_svg):
+    """Create the figure (and warm its renderer and fonts) once per worker process"""
+    global _figure, _save_svg
+    _figure = _setup_matplotlib().figure(layout='constrained')
+    _save_svg = save_svg
+
+def _render(create_chart, *args):
+    """Draw one chart on the worker's shared figure"""
+    create_chart(_figure, *args)
+
+def _needs_rebuild(outputs, deps):
+    """True unless every output exists and is at least as new as every dependency"""
+    try:
+        built = min(out.stat().st_mtime for out in outputs)
+    except FileNotFoundError:
+        return True
+    return any(dep.stat().st_mtime > built for dep in deps)
+
+def main(force=False, svg=False):
     print("=" * 60)
     print(" GENERATING BENCHMARK VISUALIZATIONS")
     print("=" * 60)
@@ -413,13 +446,46 @@ def main():
     powsybl, powermodels = load_results()
     print("✓ Results loaded")
 
-    # Generate visualizations
+    # One timing vector per package, in KEYS order
+    ps_ms = np.fromiter((powsybl['timing_ms'][k] for k in KEYS), dtype=np.float64, count=len(KEYS))
+    pm_ms = np.fromiter((powermodels['timing_ms'][k] for k in KEYS), dtype=np.float64, count=len(KEYS))
+    # Speedup of PowSyBl over PowerModels.jl (PowSyBl is faster, so ratio > 1)
+    speedups = pm_ms / ps_ms
+
+    # Generate visualizations; the charts are independent, so render them in
+    # parallel worker processes (spawned, as pyplot state is not fork-safe everywhere)
+    # Charts whose PNG (and SVG, with svg=True) is newer than both the script and the
+    # results they plot are skipped
     print("\nGenerating visualizations...")
-    create_timing_comparison(powsybl, powermodels, output_dir)
-    create_speedup_chart(powsybl, powermodels, output_dir)
-    create_memory_comparison(output_dir)
-    create_julia_compilation_impact(output_dir)
-    create_summary_dashboard(powsybl, powermodels, output_dir)
+    script = Path(__file__)
+    results_files = [Path('powsybl_results.json'), Path('powermodels_results.json'), script]
+    charts = []
+    for fn, filename, deps, args in [
+        (create_timing_comparison, 'timing_comparison.png', results_files, (ps_ms, pm_ms, output_dir)),
+        (create_speedup_chart, 'speedup_comparison.png', results_files, (speedups, output_dir)),
+        (create_memory_comparison, 'memory_comparison.png', [script], (output_dir,)),
+        (create_julia_compilation_impact, 'julia_compilation_impact.png', [script], (output_dir,)),
+        (create_summary_dashboard, 'summary_dashboard.png', results_files,
+         (powsybl, ps_ms, pm_ms, speedups, output_dir)),
+    ]:
+        outputs = [output_dir / filename]
+        if svg:
+            outputs.append(outputs[0].with_suffix('.svg'))
+        if force or _needs_rebuild(outputs, deps):
+            charts.append((fn, args))
+        else:
+            print(f"✓ {filename} is up to date")
+
+    if charts:
+        context = multiprocessing.get_context('spawn')
+        num_workers = min(len(charts), os.cpu_count() or 1)
+        if num_workers > 1:
+            _warm_font_cache()
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=context,
+                                 initializer=_init_render_worker, initargs=(svg,)) as executor:
+            futures = [executor.submit(_render, fn, *args) for fn, args in charts]
+            for future in futures:
+                future.result()
 
     print("\n" + "=" * 60)
     print(" VISUALIZATION COMPLETE")
@@ -431,6 +497,15 @@ def main():
     print("  • memory_comparison.png - Memory allocation overhead")
     print("  • julia_compilation_impact.png - Compilation overhead analysis")
     print("  • summary_dashboard.png - Comprehensive overview")
+    if svg:
+        print("  (each also as a vector .svg)")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Benchmark results visualization")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every chart, even those newer than their inputs "
+                             "(e.g. after changing VIZ_DPI)")
+    parser.add_argument("--svg", action="store_true",
+                        help="also save each chart as a vector .svg next to its PNG")
+    args = parser.parse_args()
+    main(force=args.force, svg=args.svg)